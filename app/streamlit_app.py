@@ -13,7 +13,10 @@ from streamlit_option_menu import option_menu
 # your existing project modules
 from src.parsers import extract_text_from_file
 from src.skills import load_skills
-from src.matcher import build_nlp, extract_resume_profile, parse_jd, score_resume
+from src.taxonomy import load_taxonomy
+from src.ingest import IngestedPool
+from src.matcher import build_nlp, extract_resume_profile, parse_jd
+from src.profiles import SkillVocab, JDSkills, CompactProfile, score_profile, result_row, RESULT_COLUMNS
 from src.utils import mask_pii
 
 # NEW: settings helpers
@@ -195,42 +198,58 @@ if page == "Screen & Rank":
         st.json(weights)
 
     uploads = st.file_uploader("Upload one or more resumes", type=["pdf", "docx", "txt"], accept_multiple_files=True)
+    include_ingested = st.checkbox(
+        "Include candidates from the watch-folder ingester (`python -m src.ingest`)",
+        value=False,
+    )
     run_btn = st.button("Analyze")
 
-    if run_btn and uploads and jd_text.strip():
+    if run_btn and (uploads or include_ingested) and jd_text.strip():
         try:
             # Load resources
             skills_master = load_skills("data/skills_master.csv")
-            nlp, matcher = build_nlp(skills_master)
-            jd = parse_jd(jd_text, skills_master)
+            taxonomy = load_taxonomy("data/skills_master.csv")
+            nlp, matcher = build_nlp(skills_master, taxonomy)
+            jd = parse_jd(jd_text, skills_master, taxonomy, nlp=nlp, matcher=matcher)
+            vocab = SkillVocab(skills_master)
+            jd_skills = JDSkills(jd["required_skills"], vocab)
 
             rows = []
             with st.spinner("Analyzing resumes..."):
-                for up in uploads:
+                for up in uploads or []:
                     # Extract & mask raw text for fairness
                     text = extract_text_from_file(up)
                     text = mask_pii(text)
 
                     # Build candidate profile and scores
-                    profile = extract_resume_profile(text, nlp, matcher, skills_master)
-                    scores = score_resume(
-                        profile, jd, weights=weights,
+                    profile = CompactProfile.from_dict(
+                        extract_resume_profile(text, nlp, matcher, skills_master, taxonomy), vocab
+                    )
+                    scores = score_profile(
+                        profile, jd, vocab, weights=weights, jd_skills=jd_skills,
                         resume_text=text, jd_text=jd_text  # enables semantic scoring if configured
                     )
 
-                    rows.append({
-                        "filename": up.name,
-                        "years_experience": profile.get("years_experience"),
-                        "education": profile.get("education"),
-                        "skill_match_ratio": scores.get("skill_match_ratio"),
-                        "missing_skills": ", ".join(scores.get("missing_skills", [])) if isinstance(scores.get("missing_skills"), list) else scores.get("missing_skills"),
-                        "experience_score": scores.get("experience_score"),
-                        "education_score": scores.get("education_score"),
-                        "semantic_score": scores.get("semantic_score", 0.0),
-                        "final_score": scores.get("final_score"),
-                    })
-
-            df = pd.DataFrame(rows).sort_values("final_score", ascending=False, ignore_index=True)
+                    rows.append(result_row(up.name, profile, scores, jd_skills))
+
+                # Already parsed & masked by the ingester; only scoring runs here.
+                # Profiles stay compact in the session; resume text is read from the
+                # log only when semantic scoring needs it.
+                if include_ingested:
+                    if "ingested_pool" not in st.session_state:
+                        st.session_state.ingested_pool = IngestedPool()
+                    pool = st.session_state.ingested_pool
+                    pool.refresh_if_changed()
+                    pool_jd = JDSkills(jd["required_skills"], pool.vocab)
+                    use_text = float(weights.get("embedding", 0.0)) > 0
+                    for cid, profile in pool.items():
+                        scores = score_profile(
+                            profile, jd, pool.vocab, weights=weights, jd_skills=pool_jd,
+                            resume_text=pool.text(cid) if use_text else None, jd_text=jd_text
+                        )
+                        rows.append(result_row(cid, profile, scores, pool_jd))
+
+            df = pd.DataFrame(rows, columns=RESULT_COLUMNS).sort_values("final_score", ascending=False, ignore_index=True)
 
             # Persist last results for dashboard
             os.makedirs("data", exist_ok=True)
@@ -8,9 +8,10 @@ from typing import Dict, List
 def normalize_token(s: str) -> List[str]:
     return re.sub(r"[^a-z0-9+#]", " ", (s or "").lower()).split()
 
-def expand_with_synonyms(tokens, synonyms_map):
+def expand_with_synonyms(tokens, synonyms_map, rev=None):
     expanded = set(tokens)
-    rev = {s: canon for canon, syns in synonyms_map.items() for s in syns}
+    if rev is None:
+        rev = {s: canon for canon, syns in synonyms_map.items() for s in syns}
     for t in list(expanded):
         if t in rev:
             expanded.add(rev[t])
@@ -18,13 +19,51 @@ def expand_with_synonyms(tokens, synonyms_map):
             expanded.update(synonyms_map[t])
     return expanded
 
-def skill_match_score(candidate_skills, prof, weight_req=0.7, weight_pref=0.3):
+def compile_profile(prof, taxonomy=None):
+    """
+    Precompute everything skill_match_score needs from a skills profile, once per
+    profile instead of once per candidate: the reverse synonym map and the
+    required/preferred/bonus sets. With a taxonomy, profile synonyms act as extra
+    aliases and every skill is reduced to its canonical name.
+    """
+    synonyms = prof.get("synonyms", {})
+    rev = {s: canon for canon, syns in synonyms.items() for s in syns}
+    if taxonomy is None:
+        canon = set
+    else:
+        canon = lambda xs: {taxonomy.canonical(rev.get(x, x)) or rev.get(x, x) for x in xs}
+    return {
+        "_compiled": True,
+        "synonyms": synonyms,
+        "rev": rev,
+        "taxonomy": taxonomy,
+        "required": canon(prof.get("required", [])),
+        "preferred": canon(prof.get("preferred", [])),
+        "bonus": canon(prof.get("bonus", [])),
+    }
+
+def skill_match_score(candidate_skills, prof, weight_req=0.7, weight_pref=0.3, taxonomy=None):
+    """
+    `prof` is a skills profile or the output of compile_profile() (use the latter
+    when scoring many candidates against one profile). A compiled profile carries
+    its own taxonomy; passing a different one here raises ValueError.
+    taxonomy (optional, src.taxonomy.Taxonomy): candidate skills are mapped to their
+    canonical names plus all ancestors, so e.g. 'pytorch' satisfies 'deep learning'.
+    """
+    if not prof.get("_compiled"):
+        prof = compile_profile(prof, taxonomy)
+    elif taxonomy is not None and taxonomy is not prof["taxonomy"]:
+        raise ValueError("profile was compiled with a different taxonomy; pass it to compile_profile() instead")
+    taxonomy, rev = prof["taxonomy"], prof["rev"]
+
     cand = set(normalize_token(" ".join(candidate_skills or [])))
-    cand = expand_with_synonyms(cand, prof.get("synonyms", {}))
+    if taxonomy is None:
+        cand = expand_with_synonyms(cand, prof["synonyms"], rev)
+    else:
+        phrases = {rev.get(p, p) for p in list(cand) + [c.lower().strip() for c in candidate_skills or []]}
+        cand |= phrases | taxonomy.expand(phrases)
 
-    required  = set(prof.get("required", []))
-    preferred = set(prof.get("preferred", []))
-    bonus     = set(prof.get("bonus", []))
+    required, preferred, bonus = prof["required"], prof["preferred"], prof["bonus"]
 
     req_hits   = len(required & cand)
     pref_hits  = len(preferred & cand)
@@ -42,17 +81,18 @@ def scale_years(x, xmin, xmax):
     x = max(xmin, min(x or 0, xmax))
     return (x - xmin) / (xmax - xmin)
 
-def compute_score(candidate: Dict, cfg: Dict):
+def compute_score(candidate: Dict, cfg: Dict, taxonomy=None, compiled_profile=None):
     """
     candidate keys expected:
       - years_exp: float
       - education_level: str ('bachelor', 'master', 'phd', etc.)
       - certifications: list[str]
       - skills: list[str]
+    compiled_profile: compile_profile() of the active profile, to reuse across candidates.
     Returns (score_0_100, breakdown_dict)
     """
     W = cfg["weights"]
-    prof = cfg["skills"][cfg["active_profile"]]
+    prof = compiled_profile or cfg["skills"][cfg["active_profile"]]
 
     # Experience
     exp_norm = scale_years(candidate.get("years_exp", 0),
@@ -69,7 +109,7 @@ def compute_score(candidate: Dict, cfg: Dict):
     cert_score = min(len(certs) / 3.0, 1.0)  # cap after 3
 
     # Skills
-    req_s, pref_s, bonus_hits, _ = skill_match_score(candidate.get("skills", []), prof)
+    req_s, pref_s, bonus_hits, _ = skill_match_score(candidate.get("skills", []), prof, taxonomy=taxonomy)
 
     # Weighted sum -> percentage
     total = (
@@ -0,0 +1,65 @@
+# scripts/bench_profiles.py
+# Memory + scoring time: dict profiles (extract_resume_profile/score_resume) vs
+# CompactProfile records vs the columnar ProfileStore.
+#   python scripts/bench_profiles.py --n 1000000
+#   python scripts/bench_profiles.py --n 1000000 --vocab 50000   # taxonomy-sized vocabulary
+import argparse, gc, os, random, sys, time, tracemalloc
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.matcher import EDU_ORDER, score_resume
+from src.profiles import CompactProfile, JDSkills, ProfileStore, SkillVocab, score_profile
+from src.skills import load_skills
+
+def measure(label, build, n):
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    obj = build()
+    secs = time.perf_counter() - t0
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<22} {size / 2**20:9.1f} MiB  {size / n:7.1f} B/profile  build {secs:6.2f}s")
+    return obj
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=200_000)
+    ap.add_argument("--skills", default="data/skills_master.csv")
+    ap.add_argument("--vocab", type=int, help="use N synthetic skills instead of the CSV")
+    args = ap.parse_args()
+
+    skills = [f"skill{i}" for i in range(args.vocab)] if args.vocab else load_skills(args.skills)
+    rng = random.Random(0)
+    raw = [
+        (f"cand-{i}", sorted(rng.sample(skills, rng.randint(3, 15))), rng.randint(0, 20), rng.choice(EDU_ORDER))
+        for i in range(args.n)
+    ]
+    vocab = SkillVocab(skills)
+
+    dicts = measure("dict profiles", lambda: [
+        {"matched_skills": list(sk), "years_experience": y, "education": e} for _, sk, y, e in raw
+    ], args.n)
+    compact = measure("CompactProfile list", lambda: [CompactProfile.from_dict(d, vocab) for d in dicts], args.n)
+
+    def build_store():
+        store = ProfileStore(vocab)
+        for (cid, *_), p in zip(raw, compact):
+            store.add(cid, p)
+        return store
+    store = measure("ProfileStore", build_store, args.n)
+
+    assert all(p.to_dict(vocab) == d for p, d in zip(compact, dicts)), "round trip mismatch"
+
+    jd = {"required_skills": set(rng.sample(skills, 8)), "required_years": 3, "required_education": "Bachelor"}
+    jd_skills = JDSkills(jd["required_skills"], vocab)
+    t0 = time.perf_counter()
+    a = [score_resume(d, jd) for d in dicts]
+    t1 = time.perf_counter()
+    b = [score_profile(p, jd, vocab, jd_skills=jd_skills) for _, p in store.items()]
+    t2 = time.perf_counter()
+    assert all(x["missing_skills"] == jd_skills.join(y["missing_mask"]) for x, y in zip(a, b))
+    print(f"score_resume (dict)    {t1 - t0:6.2f}s")
+    print(f"score_profile (bitset) {t2 - t1:6.2f}s")
+
+if __name__ == "__main__":
+    main()
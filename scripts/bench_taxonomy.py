@@ -0,0 +1,70 @@
+# scripts/bench_taxonomy.py
+# Load-time and match-time benchmark for the compiled skills taxonomy on a synthetic
+# 50k-skill CSV (aliases + parent/child hierarchy).
+#   python scripts/bench_taxonomy.py --skills 50000
+#   python scripts/bench_taxonomy.py --skills 50000 --spacy   # also time build_nlp/extract_skills
+import argparse, csv, os, random, sys, tempfile, time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from modules.scorer import compile_profile, skill_match_score
+from src.taxonomy import load_taxonomy
+
+def write_csv(path, n, rng):
+    names = [f"skill{i}" for i in range(n)]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["skill", "aliases", "parent"])
+        for i, s in enumerate(names):
+            aliases = "|".join(f"{s} alias{j}" for j in range(rng.randint(0, 3)))
+            parent = names[rng.randrange(i)] if i and rng.random() < 0.9 else ""
+            w.writerow([s, aliases, parent])
+    return names
+
+def timed(label, fn, repeat=1):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        out = fn()
+    ms = 1000 * (time.perf_counter() - t0) / repeat
+    print(f"{label:<38} {ms:10.3f} ms")
+    return out
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--skills", type=int, default=50_000)
+    ap.add_argument("--candidates", type=int, default=2_000)
+    ap.add_argument("--spacy", action="store_true")
+    args = ap.parse_args()
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "skills.csv")
+        names = write_csv(csv_path, args.skills, rng)
+        cache = os.path.join(tmp, "cache")
+
+        timed("compile + cache (cold)", lambda: load_taxonomy(csv_path, cache))
+        tax = timed("load (cached, mmap)", lambda: load_taxonomy(csv_path, cache), repeat=20)
+        print(f"{'skills / surface forms':<38} {len(tax):>10} / {len(tax.aliases)}")
+
+        probes = [rng.choice(names) + (" alias0" if rng.random() < 0.3 else "") for _ in range(10_000)]
+        timed("canonical() x10k", lambda: [tax.canonical(p) for p in probes])
+
+        prof = {"required": rng.sample(names, 10), "preferred": rng.sample(names, 10), "bonus": []}
+        cands = [rng.sample(names, 15) for _ in range(args.candidates)]
+        compiled = timed("compile_profile (taxonomy)", lambda: compile_profile(prof, tax))
+        timed(f"skill_match_score x{args.candidates} (taxonomy)",
+              lambda: [skill_match_score(c, compiled) for c in cands])
+
+        # same aliases as a flat per-profile synonyms map, no taxonomy
+        synonyms = {s: [f"{s} alias0"] for s in names}
+        compiled_syn = timed("compile_profile (synonyms)", lambda: compile_profile(dict(prof, synonyms=synonyms)))
+        timed(f"skill_match_score x{args.candidates} (synonyms)",
+              lambda: [skill_match_score(c, compiled_syn) for c in cands])
+
+        if args.spacy:
+            from src.matcher import build_nlp, extract_skills
+            nlp, matcher = timed("build_nlp (all surface forms)", lambda: build_nlp([], tax))
+            text = " ".join(rng.sample(names, 30)) + " experience with " + " and ".join(probes[:20])
+            timed("extract_skills x100", lambda: [extract_skills(text, nlp, matcher, tax) for _ in range(100)])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# scripts/bench_vector_index.py
+# Recall/latency of IVFIndex vs exact search on synthetic clustered 384-dim vectors
+# (same shape as all-MiniLM-L6-v2 embeddings).
+#   python scripts/bench_vector_index.py --n 100000 --k 50
+import argparse, os, sys, tempfile, time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+from src.vector_index import IVFIndex
+
+def synthetic(n, dim, n_topics, rng):
+    topics = rng.normal(size=(n_topics, dim)).astype(np.float32)
+    labels = rng.integers(n_topics, size=n)
+    return topics[labels] + 0.6 * rng.normal(size=(n, dim)).astype(np.float32)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=100_000)
+    ap.add_argument("--dim", type=int, default=384)
+    ap.add_argument("--nlist", type=int, default=256)
+    ap.add_argument("--k", type=int, default=50)
+    ap.add_argument("--queries", type=int, default=100)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    data = synthetic(args.n, args.dim, 500, rng)
+    queries = synthetic(args.queries, args.dim, 500, rng)
+    ids = [f"cand-{i}" for i in range(args.n)]
+
+    idx = IVFIndex(dim=args.dim, nlist=args.nlist)
+    t0 = time.perf_counter()
+    idx.train(data[rng.choice(args.n, size=min(args.n, 20_000), replace=False)])
+    t1 = time.perf_counter()
+    idx.add(ids, data)
+    t2 = time.perf_counter()
+    print(f"train {t1 - t0:.2f}s  add {args.n} vectors {t2 - t1:.2f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "index.npz")
+        t0 = time.perf_counter(); idx.save(path); t1 = time.perf_counter()
+        idx = IVFIndex.load(path); t2 = time.perf_counter()
+    print(f"save {t1 - t0:.2f}s  load {t2 - t1:.2f}s")
+
+    t0 = time.perf_counter()
+    truth = [{cid for cid, _ in idx.search_exact(q, k=args.k)} for q in queries]
+    exact_ms = 1000 * (time.perf_counter() - t0) / args.queries
+    print(f"exact      {exact_ms:7.2f} ms/query  recall@{args.k} 1.000")
+
+    for nprobe in sorted({1, 4, 8, 16, 32, 64, idx.nprobe}):
+        if nprobe > idx.nlist:
+            break
+        t0 = time.perf_counter()
+        found = [{cid for cid, _ in idx.query(q, k=args.k, nprobe=nprobe)} for q in queries]
+        ms = 1000 * (time.perf_counter() - t0) / args.queries
+        recall = np.mean([len(f & t) / len(t) for f, t in zip(found, truth)])
+        default = "  (default)" if nprobe == idx.nprobe else ""
+        print(f"nprobe={nprobe:<3} {ms:7.2f} ms/query  recall@{args.k} {recall:.3f}{default}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# scripts/build_vector_index.py
+# Build or incrementally update the semantic search index (IVFIndex) over the
+# stored candidate pool. Only new/changed candidates are embedded; candidates
+# that disappeared from the source are removed.
+#   python scripts/build_vector_index.py                       # from the ingest log (src.ingest)
+#   python scripts/build_vector_index.py --resumes data/samples
+import argparse, json, os, sys
+from pathlib import Path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.vector_index import IVFIndex
+
+INDEX_PATH = "data/candidates.npz"
+
+# Sources yield (id, signature, read_text); read_text() only runs for new/changed candidates.
+def from_ingested(store):
+    from src.ingest import IngestedPool
+    pool = IngestedPool(store)
+    for cid, _ in pool.items():
+        yield cid, pool.signature(cid), (lambda cid=cid: pool.text(cid))
+
+def from_folder(folder):
+    from src.parsers import extract_text_from_file
+    from src.utils import mask_pii
+    root = Path(folder)
+    for p in sorted(root.rglob("*")):
+        if p.suffix.lower() in {".pdf", ".docx", ".txt"} and p.is_file():
+            st = p.stat()
+            def read_text(p=p):
+                with open(p, "rb") as f:
+                    return mask_pii(extract_text_from_file(f))
+            yield p.relative_to(root).as_posix(), f"{st.st_mtime_ns}:{st.st_size}", read_text
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--index", default=INDEX_PATH)
+    ap.add_argument("--store", default="data/ingest/candidates.jsonl", help="ingest log to read")
+    ap.add_argument("--resumes", help="embed resume files from this folder instead of the ingest log")
+    ap.add_argument("--nlist", type=int, default=256)
+    ap.add_argument("--batch", type=int, default=256)
+    ap.add_argument("--retrain", action="store_true", help="refit centroids on everything stored")
+    args = ap.parse_args()
+
+    from src.matcher import embed_texts
+
+    index_path = Path(args.index)
+    sig_path = index_path.with_suffix(".sources.json")
+    if index_path.exists():
+        idx = IVFIndex.load(index_path)
+        sigs = json.loads(sig_path.read_text()) if sig_path.exists() else {}
+    else:
+        idx, sigs = IVFIndex(nlist=args.nlist), {}
+
+    source = from_folder(args.resumes) if args.resumes else from_ingested(args.store)
+    present, pending = set(), []
+    added = 0
+
+    def flush():
+        nonlocal added
+        if pending:
+            idx.add([cid for cid, _, _ in pending], embed_texts([t for _, _, t in pending]))
+            sigs.update({cid: sig for cid, sig, _ in pending})
+            added += len(pending)
+            pending.clear()
+
+    for cid, sig, read_text in source:
+        present.add(cid)
+        if sigs.get(cid) == sig and cid in idx:
+            continue
+        pending.append((cid, sig, read_text()))
+        if len(pending) >= args.batch:
+            flush()
+    flush()
+
+    gone = [cid for cid in sigs if cid not in present]
+    idx.remove(gone)
+    for cid in gone:
+        sigs.pop(cid)
+    if args.retrain and len(idx):
+        idx.train()
+
+    idx.save(index_path)
+    sig_path.write_text(json.dumps(sigs))
+    state = f"{len(idx._vecs)} buckets" if idx.is_trained else "flat (untrained)"
+    print(f"embedded {added}, removed {len(gone)}, {len(idx)} candidates in {index_path} [{state}]")
+
+if __name__ == "__main__":
+    main()
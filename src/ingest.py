@@ -0,0 +1,407 @@
+# --- ingest.py ---
+# Watch-folder ingestion: polls a directory (mtime/size), runs new or changed
+# resumes through parsers -> mask_pii -> extract_resume_profile in a worker pool,
+# and appends results to a durable JSONL log that doubles as the checkpoint.
+# The log is compacted to one record per file on startup and as it grows.
+#
+#   python -m src.ingest --watch /mnt/ats_drop --workers 4 --interval 5
+#
+# The app reads the same log through IngestedPool, so nothing is re-parsed.
+import argparse
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.profiles import CompactProfile, ProfileStore, SkillVocab
+
+STORE_PATH = Path("data/ingest/candidates.jsonl")
+SKILLS_PATH = "data/skills_master.csv"
+EXTENSIONS = {".pdf", ".docx", ".txt"}
+
+Job = Tuple[str, str, int, int]  # (file id, full path, mtime_ns, size)
+
+# ---------- durable log / checkpoint ----------
+def _read_log(path: Path) -> Dict[str, Dict]:
+    """Latest record per file id. A torn last line (crash mid-write) is ignored."""
+    latest = {}
+    if not path.exists():
+        return latest
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            latest[rec["id"]] = rec
+    return latest
+
+class IngestedPool:
+    """
+    What the app needs from the ingest log, kept compact: a ProfileStore of the
+    live candidates plus each one's byte offset in the log. The masked resume text
+    is not held in memory; text(cid) reads it back from the log on demand (only
+    needed for semantic scoring). Call refresh_if_changed() before each use.
+    """
+
+    def __init__(self, path=STORE_PATH):
+        self.path = Path(path)
+        self.refresh()
+
+    def _stamp(self):
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def refresh(self):
+        self._loaded_stamp = self._stamp()
+        self.vocab = SkillVocab()
+        latest = {}  # id -> (offset, CompactProfile, mtime_ns, size)
+        if self._loaded_stamp is not None:
+            with open(self.path, "rb") as f:
+                offset = 0
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                    except json.JSONDecodeError:
+                        rec = None
+                    if rec is not None:
+                        if rec.get("deleted") or "profile" not in rec:
+                            latest.pop(rec["id"], None)
+                        else:
+                            latest[rec["id"]] = (offset, CompactProfile.from_dict(rec["profile"], self.vocab),
+                                                 rec.get("mtime_ns") or 0, rec.get("size") or 0)
+                    offset += len(line)
+        self.store = ProfileStore(self.vocab)
+        self.offsets = array("Q")
+        self.mtimes = array("q")
+        self.sizes = array("Q")
+        for cid, (offset, profile, mtime_ns, size) in latest.items():
+            self.store.add(cid, profile)
+            self.offsets.append(offset)
+            self.mtimes.append(mtime_ns)
+            self.sizes.append(size)
+
+    def refresh_if_changed(self) -> bool:
+        if self._stamp() == self._loaded_stamp:
+            return False
+        self.refresh()
+        return True
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __contains__(self, cid: str) -> bool:
+        return cid in self.store
+
+    def items(self):
+        """(file id, CompactProfile) for every live ingested candidate."""
+        return self.store.items()
+
+    def signature(self, cid: str) -> str:
+        """'mtime_ns:size' of the source file when it was ingested."""
+        i = self.store.row(cid)
+        return f"{self.mtimes[i]}:{self.sizes[i]}"
+
+    def text(self, cid: str) -> str:
+        """Masked resume text for one candidate, read from the log."""
+        for _ in range(2):
+            with open(self.path, "rb") as f:
+                f.seek(self.offsets[self.store.row(cid)])
+                line = f.readline()
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                rec = {}
+            if rec.get("id") == cid:
+                return rec.get("text", "")
+            # the log was compacted or rewritten since it was indexed
+            self.refresh()
+        raise KeyError(cid)
+
+def _repair_log(path: Path):
+    """Truncate a torn trailing line so the next append starts on a fresh line."""
+    if not path.exists():
+        return
+    with open(path, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        while pos > 0:
+            step = min(pos, 1 << 16)
+            f.seek(pos - step)
+            chunk = f.read(step)
+            nl = chunk.rfind(b"\n")
+            if nl >= 0:
+                pos = pos - step + nl + 1
+                break
+            pos -= step
+        if pos != end:
+            f.truncate(pos)
+            f.flush()
+            os.fsync(f.fileno())
+
+def _append(path: Path, records: List[Dict]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "ab") as f:
+        for rec in records:
+            f.write((json.dumps(rec) + "\n").encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+
+def compact_log(path=STORE_PATH) -> int:
+    """
+    Rewrite the log to the latest record per live file id (dropping superseded
+    records and deletions), atomically via os.replace. Returns the records kept.
+    """
+    path = Path(path)
+    live = [rec for rec in _read_log(path).values() if not rec.get("deleted")]
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        for rec in live:
+            f.write((json.dumps(rec) + "\n").encode("utf-8"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return len(live)
+
+# ---------- worker side (one spaCy pipeline per process) ----------
+_worker = {}
+
+def _init_worker(skills_path: str):
+    from src.matcher import build_nlp
+    from src.skills import load_skills
+    from src.taxonomy import load_taxonomy
+    skills = load_skills(skills_path)
+    taxonomy = load_taxonomy(skills_path)
+    nlp, matcher = build_nlp(skills, taxonomy)
+    _worker.update(skills=skills, taxonomy=taxonomy, nlp=nlp, matcher=matcher)
+
+def _ping() -> bool:
+    return True
+
+def _process(job: Job) -> Dict:
+    from src.matcher import extract_resume_profile
+    from src.parsers import extract_text_from_file
+    from src.utils import mask_pii
+    cid, full_path, mtime_ns, size = job
+    rec = {"id": cid, "mtime_ns": mtime_ns, "size": size, "ingested_at": time.time()}
+    try:
+        with open(full_path, "rb") as f:
+            text = mask_pii(extract_text_from_file(f))
+        rec["profile"] = extract_resume_profile(
+            text, _worker["nlp"], _worker["matcher"], _worker["skills"], _worker["taxonomy"]
+        )
+        rec["text"] = text
+    except Exception as e:
+        # recorded so the file is not retried until it changes
+        rec["error"] = f"{type(e).__name__}: {e}"
+    return rec
+
+# ---------- daemon ----------
+class Ingester:
+    """
+    Polls `watch_dir` and ingests files whose (mtime, size) differ from the log.
+    Files modified within the last `settle` seconds are skipped until the next
+    poll so half-copied uploads are not parsed. `job_timeout` is how long the pool
+    may go without finishing any file before it is treated as hung.
+    """
+
+    def __init__(self, watch_dir, store_path=STORE_PATH, skills_path: str = SKILLS_PATH,
+                 workers: int = 4, settle: float = 2.0, job_timeout: float = 120.0,
+                 init_timeout: float = 600.0):
+        self.watch_dir = Path(watch_dir)
+        self.store_path = Path(store_path)
+        self.skills_path = skills_path
+        self.workers = workers
+        self.settle = settle
+        self.job_timeout = job_timeout
+        self.init_timeout = init_timeout
+        self.pool_error: Optional[str] = None
+        self._recorded = 0
+        _repair_log(self.store_path)
+        if self.store_path.exists():
+            compact_log(self.store_path)
+        self.seen = {cid: (rec.get("mtime_ns"), rec.get("size"))
+                     for cid, rec in _read_log(self.store_path).items() if not rec.get("deleted")}
+        self._log_records = len(self.seen)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def scan(self) -> Tuple[List[Job], List[str]]:
+        """(jobs for new/changed files, ids of files that disappeared)."""
+        now = time.time()
+        jobs, present = [], set()
+        for p in self.watch_dir.rglob("*"):
+            if p.suffix.lower() not in EXTENSIONS or not p.is_file():
+                continue
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            cid = p.relative_to(self.watch_dir).as_posix()
+            present.add(cid)
+            if self.seen.get(cid) == (st.st_mtime_ns, st.st_size):
+                continue
+            if now - st.st_mtime < self.settle:
+                continue
+            jobs.append((cid, str(p), st.st_mtime_ns, st.st_size))
+        gone = [cid for cid in self.seen if cid not in present]
+        return jobs, gone
+
+    def run_once(self) -> int:
+        """One poll: ingest changes, record deletions. Returns number of files ingested."""
+        jobs, gone = self.scan()
+        recorded = self._recorded
+        if gone:
+            self._write([{"id": cid, "deleted": True, "ingested_at": time.time()} for cid in gone])
+            for cid in gone:
+                self.seen.pop(cid, None)
+        if jobs:
+            self._run_jobs(jobs)
+        # keep the log (and what the app re-reads) close to one record per live file
+        if self._log_records > max(1000, 2 * len(self.seen)):
+            self._log_records = compact_log(self.store_path)
+        return self._recorded - recorded
+
+    def _write(self, records: List[Dict]):
+        _append(self.store_path, records)
+        self._log_records += len(records)
+
+    def _record(self, rec: Dict):
+        self._write([rec])
+        self._recorded += 1
+        self.seen[rec["id"]] = (rec["mtime_ns"], rec["size"])
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # compile the taxonomy cache once here rather than racing in every worker
+            from src.taxonomy import load_taxonomy
+            load_taxonomy(self.skills_path)
+            self._pool = ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(self.skills_path,))
+        return self._pool
+
+    def _kill_pool(self):
+        """Tear the pool down, terminating workers (a hung parser would block a normal shutdown)."""
+        if self._pool is None:
+            return
+        for proc in list((getattr(self._pool, "_processes", None) or {}).values()):
+            proc.terminate()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+
+    def _start_pool(self) -> bool:
+        """
+        Make sure a pool is up and its workers initialised (spaCy model, taxonomy) by
+        running a no-op. False means the pool itself is broken, not any file.
+        """
+        try:
+            self._get_pool().submit(_ping).result(timeout=self.init_timeout)
+            self.pool_error = None
+            return True
+        except Exception as e:
+            self._kill_pool()
+            self.pool_error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+            print(f"worker pool failed to start ({self.pool_error}); will retry", flush=True)
+            return False
+
+    def _run_group(self, jobs: List[Job]) -> Tuple[List[Job], str]:
+        """
+        Run jobs in parallel, logging each result as it completes. Returns the jobs
+        that did not finish and why: "crash" if a worker died (every in-flight job
+        then fails with BrokenProcessPool), "timeout" if nothing completed for
+        job_timeout seconds (the pool is killed).
+        """
+        pool = self._get_pool()
+        futures = {pool.submit(_process, job): job for job in jobs}
+        pending, unfinished, reason = set(futures), [], ""
+        while pending:
+            done, pending = wait(pending, timeout=self.job_timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                self._kill_pool()
+                unfinished.extend(futures[f] for f in pending)
+                return unfinished, "timeout"
+            for fut in done:
+                try:
+                    self._record(fut.result())
+                except BrokenProcessPool:
+                    unfinished.append(futures[fut])
+                    reason = "crash"
+        return unfinished, reason
+
+    def _run_jobs(self, jobs: List[Job]):
+        """
+        Ingest jobs, isolating files that kill or hang a worker. After a pool failure
+        the unfinished jobs are resubmitted together to a fresh pool; a group that
+        fails again is bisected, so innocent files keep running in parallel and only
+        a file that alone breaks a healthy pool gets an error record. If a fresh pool
+        cannot even start, nothing is recorded and the rest waits for the next poll.
+        """
+        queue = [(jobs, False)]  # (group, already failed once)
+        while queue:
+            group, retried = queue.pop()
+            if not self._start_pool():
+                return
+            unfinished, reason = self._run_group(group)
+            if not unfinished:
+                continue
+            self._kill_pool()
+            if not retried:
+                queue.append((unfinished, True))
+            elif len(unfinished) > 1:
+                mid = len(unfinished) // 2
+                queue.extend([(unfinished[:mid], True), (unfinished[mid:], True)])
+            elif self._start_pool():
+                # the pool is healthy again, so this one file is what broke it
+                cid, _, mtime_ns, size = unfinished[0]
+                what = "timed out" if reason == "timeout" else "crashed"
+                self._record({"id": cid, "mtime_ns": mtime_ns, "size": size, "ingested_at": time.time(),
+                              "error": f"worker {what} while processing this file"})
+            else:
+                return
+
+    def run(self, interval: float = 5.0):
+        delay = interval
+        try:
+            while True:
+                n = self.run_once()
+                if n:
+                    print(f"ingested {n} file(s); {len(self.seen)} tracked", flush=True)
+                # back off while the worker pool cannot start
+                delay = min(delay * 2, 300.0) if self.pool_error else interval
+                time.sleep(delay)
+        finally:
+            self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+def main():
+    ap = argparse.ArgumentParser(description="Watch a directory and ingest resumes incrementally.")
+    ap.add_argument("--watch", required=True, help="directory the ATS drops resumes into")
+    ap.add_argument("--store", default=str(STORE_PATH))
+    ap.add_argument("--skills", default=SKILLS_PATH)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    ap.add_argument("--interval", type=float, default=5.0, help="seconds between polls")
+    ap.add_argument("--job-timeout", type=float, default=120.0,
+                    help="seconds without any file finishing before the pool is treated as hung")
+    ap.add_argument("--once", action="store_true", help="process pending files and exit")
+    args = ap.parse_args()
+
+    ing = Ingester(args.watch, args.store, args.skills, workers=args.workers, job_timeout=args.job_timeout)
+    if args.once:
+        try:
+            print(f"ingested {ing.run_once()} file(s)")
+        finally:
+            ing.close()
+    else:
+        ing.run(args.interval)
+
+if __name__ == "__main__":
+    main()
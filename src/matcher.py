@@ -27,6 +27,11 @@ def semantic_similarity(resume_text: str, jd_text: str) -> float:
     _ensure_embed_model()
     v = _embed_model.encode([resume_text, jd_text])
     return _cosine(v[0], v[1])
+
+def embed_texts(texts: List[str]):
+    """Encode texts with the same model as semantic_similarity (float32, one row per text)."""
+    _ensure_embed_model()
+    return _np.asarray(_embed_model.encode(list(texts)), dtype=_np.float32)
 # =========================================================
 
 EDU_LEVELS = {
@@ -37,17 +42,23 @@ EDU_LEVELS = {
 
 YEARS_RE = re.compile(r"(\d+)\+?\s+years?")
 
-def build_nlp(skills: List[str]):
+def build_nlp(skills: List[str], taxonomy=None):
+    """With a compiled taxonomy (src.taxonomy), every canonical name and alias becomes a pattern."""
     nlp = spacy.load("en_core_web_sm")
     matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
-    patterns = [nlp.make_doc(s) for s in skills]
+    phrases = taxonomy.surface_forms() if taxonomy is not None else skills
+    patterns = list(nlp.tokenizer.pipe(phrases))
     matcher.add("SKILL", patterns)
     return nlp, matcher
 
-def extract_skills(text: str, nlp, matcher) -> Set[str]:
+def extract_skills(text: str, nlp, matcher, taxonomy=None) -> Set[str]:
     doc = nlp(text)
     matches = matcher(doc)
-    return {doc[s:e].text.lower().strip() for _, s, e in matches}
+    found = {doc[s:e].text.lower().strip() for _, s, e in matches}
+    if taxonomy is not None:
+        # aliases -> canonical skill names
+        found = {taxonomy.canonical(f) or f for f in found}
+    return found
 
 def extract_years_experience(text: str) -> int:
     years = 0
@@ -65,21 +76,24 @@ def extract_education(text: str) -> str:
     if any(k in t for k in EDU_LEVELS["bachelor"]): return "Bachelor"
     return "Unknown"
 
-def parse_jd(jd_text: str, skills_master: List[str]) -> Dict:
-    nlp, matcher = build_nlp(skills_master)
-    req_skills = extract_skills(jd_text, nlp, matcher)
+def parse_jd(jd_text: str, skills_master: List[str], taxonomy=None, *, nlp=None, matcher=None) -> Dict:
+    if nlp is None or matcher is None:
+        nlp, matcher = build_nlp(skills_master, taxonomy)
+    req_skills = extract_skills(jd_text, nlp, matcher, taxonomy)
     req_years = extract_years_experience(jd_text)
     req_edu = extract_education(jd_text)
     return {"required_skills": req_skills, "required_years": req_years, "required_education": req_edu}
 
-def extract_resume_profile(resume_text: str, nlp, matcher, skills_master: List[str]) -> Dict:
-    sk = extract_skills(resume_text, nlp, matcher)
+def extract_resume_profile(resume_text: str, nlp, matcher, skills_master: List[str], taxonomy=None) -> Dict:
+    sk = extract_skills(resume_text, nlp, matcher, taxonomy)
     yrs = extract_years_experience(resume_text)
     edu = extract_education(resume_text)
     return {"matched_skills": sorted(list(sk)), "years_experience": yrs, "education": edu}
 
+EDU_ORDER = ["Unknown", "Bachelor", "Master", "PhD"]
+
 def _education_score(candidate: str, required: str) -> float:
-    order = ["Unknown", "Bachelor", "Master", "PhD"]
+    order = EDU_ORDER
     c = order.index(candidate) if candidate in order else 0
     r = order.index(required) if required in order else 0
     return 1.0 if c >= r else (0.7 if (c == 1 and r == 2) else 0.4)
@@ -96,8 +110,6 @@ def score_resume(
     Now supports semantic scoring via embeddings when weights['embedding'] > 0
     and resume_text/jd_text are provided.
     """
-    weights = weights or {"skills": 0.6, "experience": 0.25, "education": 0.15, "embedding": 0.0}
-
     rs = jd.get("required_skills", set())
     found = set(profile.get("matched_skills", []))
     missing = sorted(list(rs - found))
@@ -105,11 +117,33 @@ def score_resume(
     total = len(rs) if rs else 1
     skills_ratio = overlap / total
 
+    return _combine_scores(
+        skills_ratio, {"missing_skills": ", ".join(missing)},
+        profile.get("years_experience", 0), profile.get("education", "Unknown"),
+        jd, weights, resume_text=resume_text, jd_text=jd_text,
+    )
+
+def _combine_scores(
+    skills_ratio: float,
+    missing: Dict,
+    exp_have: int,
+    education: str,
+    jd: Dict,
+    weights: Dict = None,
+    *,
+    resume_text: Optional[str] = None,
+    jd_text: Optional[str] = None,
+) -> Dict:
+    """
+    Experience/education/semantic scores + weighted total; shared by dict and compact profiles.
+    `missing` holds the caller's missing-skills entry (e.g. {"missing_skills": "a, b"}).
+    """
+    weights = weights or {"skills": 0.6, "experience": 0.25, "education": 0.15, "embedding": 0.0}
+
     exp_req = jd.get("required_years", 0)
-    exp_have = profile.get("years_experience", 0)
     exp_score = 1.0 if exp_req == 0 else min(1.0, exp_have / exp_req)
 
-    edu_score = _education_score(profile.get("education", "Unknown"), jd.get("required_education", "Unknown"))
+    edu_score = _education_score(education, jd.get("required_education", "Unknown"))
 
     # --- semantic score ---
     emb_w = float(weights.get("embedding", 0.0))
@@ -129,7 +163,7 @@ def score_resume(
 
     return {
         "skill_match_ratio": round(skills_ratio, 3),
-        "missing_skills": ", ".join(missing),
+        **missing,
         "experience_score": round(exp_score, 3),
         "education_score": round(edu_score, 3),
         "semantic_score": round(sem_score, 3),
@@ -0,0 +1,200 @@
+# --- profiles.py ---
+# Compact candidate profiles: skills are interned to integer ids and each profile
+# keeps only its own ids (sorted array('I'), 4 bytes per skill), so its size follows
+# the number of skills it has, not the size of the vocabulary. Scoring maps those
+# ids onto a small JD-local bitmask, so overlap/missing are bitwise ops.
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+from src.matcher import EDU_ORDER, _combine_scores
+
+class SkillVocab:
+    """Skill string <-> integer id. Seed with load_skills(); unseen skills get new ids."""
+
+    def __init__(self, skills: Iterable[str] = ()):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        for s in skills:
+            self.intern(s)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def intern(self, skill: str) -> int:
+        sid = self.ids.get(skill)
+        if sid is None:
+            sid = self.ids[skill] = len(self.names)
+            self.names.append(skill)
+        return sid
+
+    def encode(self, skills: Iterable[str]) -> array:
+        """Sorted, de-duplicated skill ids."""
+        return array("I", sorted({self.intern(s) for s in skills}))
+
+    def decode(self, ids: Iterable[int]) -> List[str]:
+        """Sorted skill names (same order as extract_resume_profile)."""
+        return sorted(self.names[i] for i in ids)
+
+class JDSkills:
+    """
+    A JD's required skills as a local bitmask: bit k <-> k-th required skill.
+    Build once per JD; masks are only as wide as the JD's skill list.
+    """
+    __slots__ = ("names", "bits", "full")
+
+    def __init__(self, required: Iterable[str], vocab: SkillVocab):
+        self.names = sorted(set(required))
+        self.bits = {vocab.intern(s): 1 << k for k, s in enumerate(self.names)}
+        self.full = (1 << len(self.names)) - 1
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def mask(self, skill_ids: Iterable[int]) -> int:
+        m = 0
+        bits = self.bits
+        for sid in skill_ids:
+            m |= bits.get(sid, 0)
+        return m
+
+    def join(self, mask: int) -> str:
+        """Comma-separated names for a JD-local mask (sorted, like score_resume)."""
+        return ", ".join(s for k, s in enumerate(self.names) if mask >> k & 1)
+
+def _edu_code(education: str) -> int:
+    return EDU_ORDER.index(education) if education in EDU_ORDER else 0
+
+class CompactProfile:
+    """Slots record for one candidate: sorted skill ids, years, education code (index into EDU_ORDER)."""
+    __slots__ = ("skills", "years_experience", "education_code")
+
+    def __init__(self, skills: Optional[array] = None, years_experience: int = 0, education_code: int = 0):
+        self.skills = skills if skills is not None else array("I")
+        self.years_experience = years_experience
+        self.education_code = education_code
+
+    @property
+    def education(self) -> str:
+        return EDU_ORDER[self.education_code]
+
+    @classmethod
+    def from_dict(cls, profile: Dict, vocab: SkillVocab) -> "CompactProfile":
+        """Build from the dict returned by extract_resume_profile()."""
+        return cls(
+            vocab.encode(profile.get("matched_skills", [])),
+            profile.get("years_experience", 0),
+            _edu_code(profile.get("education", "Unknown")),
+        )
+
+    def to_dict(self, vocab: SkillVocab) -> Dict:
+        """Inverse of from_dict (lossless)."""
+        return {
+            "matched_skills": vocab.decode(self.skills),
+            "years_experience": self.years_experience,
+            "education": self.education,
+        }
+
+def score_profile(
+    profile: CompactProfile,
+    jd: Dict,
+    vocab: SkillVocab,
+    weights: Dict = None,
+    *,
+    jd_skills: Optional[JDSkills] = None,
+    resume_text: Optional[str] = None,
+    jd_text: Optional[str] = None,
+) -> Dict:
+    """
+    score_resume() for a CompactProfile. Pass jd_skills = JDSkills(jd["required_skills"], vocab)
+    when scoring many candidates against one JD. Missing skills come back as a JD-local
+    bitmask under "missing_mask" (no per-candidate string); result_row() or
+    jd_skills.join() turns it into the usual comma-separated "missing_skills".
+    """
+    if jd_skills is None:
+        jd_skills = JDSkills(jd.get("required_skills", set()), vocab)
+    matched = jd_skills.mask(profile.skills)
+    skills_ratio = matched.bit_count() / (len(jd_skills) or 1)
+    return _combine_scores(
+        skills_ratio, {"missing_mask": jd_skills.full & ~matched},
+        profile.years_experience, profile.education,
+        jd, weights, resume_text=resume_text, jd_text=jd_text,
+    )
+
+RESULT_COLUMNS = [
+    "filename", "years_experience", "education", "skill_match_ratio", "missing_skills",
+    "experience_score", "education_score", "semantic_score", "final_score",
+]
+
+def result_row(filename: str, profile: CompactProfile, scores: Dict, jd_skills: JDSkills) -> Dict:
+    """One row of the ranked-candidates CSV (same columns as data/last_results.csv)."""
+    return {
+        "filename": filename,
+        "years_experience": profile.years_experience,
+        "education": profile.education,
+        "skill_match_ratio": scores.get("skill_match_ratio"),
+        "missing_skills": jd_skills.join(scores.get("missing_mask", 0)),
+        "experience_score": scores.get("experience_score"),
+        "education_score": scores.get("education_score"),
+        "semantic_score": scores.get("semantic_score", 0.0),
+        "final_score": scores.get("final_score"),
+    }
+
+class ProfileStore:
+    """
+    Columnar store for many candidates: all skill ids in one flat array('I') with
+    per-row start/count, and years/education in typed arrays. Overwriting a row
+    appends its new ids (the old slice is left unused).
+    """
+
+    def __init__(self, vocab: SkillVocab):
+        self.vocab = vocab
+        self.ids: List[str] = []
+        self.skill_ids = array("I")
+        self.start = array("Q")
+        self.count = array("H")
+        self.years = array("H")
+        self.education = array("B")
+        self._pos: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, cid: str) -> bool:
+        return cid in self._pos
+
+    def add(self, cid: str, profile: CompactProfile):
+        """Append a candidate, or overwrite it in place if the id is already stored."""
+        years = max(0, min(int(profile.years_experience or 0), 0xFFFF))
+        start = len(self.skill_ids)
+        self.skill_ids.extend(profile.skills)
+        i = self._pos.get(cid)
+        if i is None:
+            self._pos[cid] = len(self.ids)
+            self.ids.append(cid)
+            self.start.append(start)
+            self.count.append(len(profile.skills))
+            self.years.append(years)
+            self.education.append(profile.education_code)
+        else:
+            self.start[i] = start
+            self.count[i] = len(profile.skills)
+            self.years[i] = years
+            self.education[i] = profile.education_code
+
+    def _row(self, i: int) -> CompactProfile:
+        lo = self.start[i]
+        return CompactProfile(self.skill_ids[lo:lo + self.count[i]], self.years[i], self.education[i])
+
+    def row(self, cid: str) -> int:
+        """Row number of a candidate, for callers keeping parallel per-row arrays."""
+        return self._pos[cid]
+
+    def get(self, cid: str) -> CompactProfile:
+        return self._row(self._pos[cid])
+
+    def items(self):
+        for i, cid in enumerate(self.ids):
+            yield cid, self._row(i)
+
+    def to_dicts(self) -> Dict[str, Dict]:
+        return {cid: p.to_dict(self.vocab) for cid, p in self.items()}
@@ -0,0 +1,206 @@
+# --- taxonomy.py ---
+# Compiled skills taxonomy: alias -> canonical skill and ancestor closures,
+# built from the skills CSV and cached on disk (keyed by the CSV's content hash)
+# as .npy arrays that are memory-mapped on load.
+#
+# CSV schema (only `skill` is required, so the flat skills_master.csv works as-is):
+#   skill,aliases,parent
+#   pytorch,torch|py-torch,deep learning
+#   deep learning,dl,machine learning
+# `aliases` and `parent` are "|"-separated; a parent not listed as a skill is added.
+import csv
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+CACHE_DIR = Path("data/.taxonomy")
+FORMAT_VERSION = 1
+
+def normalize_phrase(s: str) -> str:
+    return " ".join((s or "").lower().split())
+
+def _split(field: Optional[str]) -> List[str]:
+    return [normalize_phrase(p) for p in (field or "").split("|") if p.strip()]
+
+class _StringTable:
+    """Sorted UTF-8 strings in one byte blob + offsets; works directly on memory-mapped arrays."""
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self.blob = blob
+        self.offsets = offsets
+        # memoryviews index to plain bytes/ints, much cheaper than numpy scalars
+        self._blob = memoryview(blob)
+        self._off = memoryview(offsets)
+
+    @staticmethod
+    def build(strings: List[bytes]):
+        offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(s) for s in strings])
+        blob = np.frombuffer(b"".join(strings), dtype=np.uint8)
+        return blob, offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def raw(self, i: int) -> bytes:
+        return self._blob[self._off[i]:self._off[i + 1]].tobytes()
+
+    def __getitem__(self, i: int) -> str:
+        return self.raw(i).decode("utf-8")
+
+    def find(self, s: str) -> int:
+        """Index of s, or -1 (binary search, no full decode of the table)."""
+        key = s.encode("utf-8")
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.raw(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < len(self) and self.raw(lo) == key else -1
+
+class Taxonomy:
+    """
+    Read-only view over a compiled taxonomy.
+
+    - canonical(phrase): canonical skill for a name or alias (None if unknown)
+    - ancestors(skill): all parents, grandparents, ... of a canonical skill
+    - expand(phrases): canonical forms of the known phrases plus their ancestors
+    - surface_forms(): every canonical name and alias (for the spaCy PhraseMatcher)
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.names = _StringTable(arrays["names_blob"], arrays["names_off"])
+        self.aliases = _StringTable(arrays["alias_blob"], arrays["alias_off"])
+        self.alias_target = arrays["alias_target"]
+        self.anc_off = arrays["anc_off"]
+        self.anc = arrays["anc"]
+        self._memo: Dict[str, int] = {}
+        self._closure: Dict[int, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _canonical_id(self, phrase: str) -> int:
+        p = normalize_phrase(phrase)
+        cid = self._memo.get(p)
+        if cid is None:
+            i = self.aliases.find(p)
+            cid = self._memo[p] = int(self.alias_target[i]) if i >= 0 else -1
+        return cid
+
+    def canonical(self, phrase: str) -> Optional[str]:
+        cid = self._canonical_id(phrase)
+        return self.names[cid] if cid >= 0 else None
+
+    def _names_with_ancestors(self, cid: int) -> tuple:
+        names = self._closure.get(cid)
+        if names is None:
+            lo, hi = int(self.anc_off[cid]), int(self.anc_off[cid + 1])
+            names = self._closure[cid] = (self.names[cid],) + tuple(self.names[int(a)] for a in self.anc[lo:hi])
+        return names
+
+    def ancestors(self, skill: str) -> List[str]:
+        cid = self._canonical_id(skill)
+        return list(self._names_with_ancestors(cid)[1:]) if cid >= 0 else []
+
+    def expand(self, phrases: Iterable[str]) -> Set[str]:
+        out = set()
+        for p in phrases:
+            cid = self._canonical_id(p)
+            if cid >= 0:
+                out.update(self._names_with_ancestors(cid))
+        return out
+
+    def surface_forms(self) -> List[str]:
+        return [self.aliases[i] for i in range(len(self.aliases))]
+
+def _read_rows(data: bytes):
+    reader = csv.DictReader(io.StringIO(data.decode("utf-8-sig")))
+    for row in reader:
+        skill = normalize_phrase(row.get("skill", ""))
+        if skill:
+            yield skill, _split(row.get("aliases")), _split(row.get("parent"))
+
+def _compile(data: bytes) -> Dict[str, np.ndarray]:
+    parents: Dict[str, List[str]] = {}
+    alias_rows = []
+    for skill, aliases, pars in _read_rows(data):
+        parents.setdefault(skill, [])
+        parents[skill].extend(p for p in pars if p != skill)
+        alias_rows.extend((a, skill) for a in aliases)
+    for pars in list(parents.values()):
+        for p in pars:
+            parents.setdefault(p, [])
+
+    names = sorted(parents, key=lambda s: s.encode("utf-8"))
+    ids = {s: i for i, s in enumerate(names)}
+
+    # canonical names always map to themselves; otherwise the first alias row wins
+    alias_map = {s: ids[s] for s in names}
+    for a, skill in alias_rows:
+        alias_map.setdefault(a, ids[skill])
+    alias_keys = sorted(alias_map, key=lambda s: s.encode("utf-8"))
+
+    # transitive ancestor closure (iterative DFS, cycle-safe)
+    anc_off = np.zeros(len(names) + 1, dtype=np.int64)
+    anc: List[int] = []
+    for i, s in enumerate(names):
+        seen, stack = set(), list(parents[s])
+        while stack:
+            p = stack.pop()
+            if p != s and p not in seen:
+                seen.add(p)
+                stack.extend(parents[p])
+        anc.extend(sorted(ids[p] for p in seen))
+        anc_off[i + 1] = len(anc)
+
+    names_blob, names_off = _StringTable.build([s.encode("utf-8") for s in names])
+    alias_blob, alias_off = _StringTable.build([s.encode("utf-8") for s in alias_keys])
+    return {
+        "names_blob": names_blob, "names_off": names_off,
+        "alias_blob": alias_blob, "alias_off": alias_off,
+        "alias_target": np.array([alias_map[a] for a in alias_keys], dtype=np.int32),
+        "anc_off": anc_off, "anc": np.array(anc, dtype=np.int32),
+    }
+
+def load_taxonomy(path: str, cache_dir=None) -> Taxonomy:
+    """
+    Load the taxonomy for a skills CSV, compiling it on first use.
+    The compiled artifact lives in <cache_dir>/<sha256 of CSV>/ and is reused
+    (memory-mapped) until the CSV contents change.
+    """
+    data = Path(path).read_bytes()
+    digest = hashlib.sha256(b"v%d\n" % FORMAT_VERSION + data).hexdigest()[:16]
+    cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR
+    target = cache_dir / digest
+    manifest = target / "manifest.json"
+
+    if not manifest.exists():
+        arrays = _compile(data)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = Path(tempfile.mkdtemp(dir=cache_dir, prefix=".tmp-"))
+        try:
+            for name, arr in arrays.items():
+                np.save(tmp / f"{name}.npy", arr)
+            (tmp / "manifest.json").write_text(json.dumps({
+                "version": FORMAT_VERSION, "source": str(path), "sha256": digest,
+                "skills": len(arrays["names_off"]) - 1, "arrays": sorted(arrays),
+            }))
+            os.replace(tmp, target)
+        except OSError:
+            # another process compiled the same CSV first; use theirs
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not manifest.exists():
+                raise
+
+    meta = json.loads(manifest.read_text())
+    return Taxonomy({name: np.load(target / f"{name}.npy", mmap_mode="r") for name in meta["arrays"]})
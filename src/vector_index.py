@@ -0,0 +1,188 @@
+# --- vector_index.py ---
+# Approximate nearest-neighbour search over stored candidate embeddings.
+# IVF (inverted file) index in pure NumPy: vectors are bucketed by their nearest
+# k-means centroid and a query only scans the `nprobe` closest buckets.
+import json
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+def _normalize(x: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float32)
+    if x.ndim == 1:
+        x = x[None, :]
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return x / norms
+
+def _kmeans(x: np.ndarray, k: int, iters: int = 10, seed: int = 0) -> np.ndarray:
+    """Spherical k-means (cosine) on row-normalized vectors; returns k x dim centroids."""
+    rng = np.random.default_rng(seed)
+    k = max(1, min(k, len(x)))
+    centroids = x[rng.choice(len(x), size=k, replace=False)].copy()
+    for _ in range(iters):
+        assign = (x @ centroids.T).argmax(axis=1)
+        for c in range(k):
+            members = x[assign == c]
+            if len(members):
+                centroids[c] = members.sum(axis=0)
+            else:
+                # re-seed empty clusters so every bucket stays useful
+                centroids[c] = x[rng.integers(len(x))]
+        centroids = _normalize(centroids)
+    return centroids
+
+class IVFIndex:
+    """
+    Cosine-similarity IVF index keyed by string candidate ids.
+
+    - `nlist`: target number of buckets (more buckets -> faster queries, lower recall per probe).
+    - `nprobe`: buckets scanned per query (default nlist // 4); raise for recall, lower for speed.
+
+    Until `train()` has run the index is a single flat bucket (exact search). Inserts are
+    buffered there and the index trains itself once it holds `train_min` (40 x nlist) vectors;
+    call `train()` again later to refit the centroids on everything stored.
+    """
+
+    def __init__(self, dim: int = 384, nlist: int = 256, nprobe: Optional[int] = None):
+        self.dim = dim
+        self.nlist = nlist
+        self.nprobe = nprobe or max(1, nlist // 4)
+        self.train_min = 40 * nlist
+        self.centroids: Optional[np.ndarray] = None
+        self._vecs: List[np.ndarray] = [np.empty((0, dim), dtype=np.float32)]
+        self._ids: List[List[str]] = [[]]
+        self._where = {}  # id -> bucket number
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, cid: str) -> bool:
+        return cid in self._where
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    def _stored(self) -> Tuple[np.ndarray, List[str]]:
+        return np.concatenate(self._vecs), [cid for ids in self._ids for cid in ids]
+
+    def _assign(self, ids: List[str], x: np.ndarray):
+        if not self.is_trained:
+            assign = np.zeros(len(x), dtype=np.int64)
+        else:
+            assign = (x @ self.centroids.T).argmax(axis=1)
+        for c in np.unique(assign):
+            rows = np.nonzero(assign == c)[0]
+            self._vecs[c] = np.concatenate([self._vecs[c], x[rows]])
+            for r in rows:
+                self._ids[c].append(ids[r])
+                self._where[ids[r]] = int(c)
+
+    def train(self, vectors=None, iters: int = 10, seed: int = 0):
+        """
+        Fit bucket centroids on `vectors` (default: everything stored) and
+        redistribute the stored vectors. Safe to call again to retrain.
+        """
+        stored, ids = self._stored()
+        x = stored if vectors is None else _normalize(vectors)
+        if not len(x):
+            raise ValueError("no vectors to train on")
+        self.centroids = _kmeans(x, self.nlist, iters=iters, seed=seed)
+        self._vecs = [np.empty((0, self.dim), dtype=np.float32) for _ in range(len(self.centroids))]
+        self._ids = [[] for _ in range(len(self.centroids))]
+        self._where = {}
+        if ids:
+            self._assign(ids, stored)
+
+    def add(self, ids: Sequence[str], vectors):
+        """Insert (or replace) candidates. If an id repeats within the batch, the last vector wins."""
+        x = _normalize(vectors)
+        if len(ids) != len(x):
+            raise ValueError("ids and vectors must have the same length")
+        if x.shape[1] != self.dim:
+            raise ValueError(f"expected {self.dim}-dim vectors, got {x.shape[1]}")
+        last = {cid: r for r, cid in enumerate(ids)}
+        rows = sorted(last.values())
+        ids, x = [ids[r] for r in rows], x[rows]
+
+        self.remove([i for i in ids if i in self._where])
+        self._assign(ids, x)
+        if not self.is_trained and len(self) >= self.train_min:
+            self.train()
+
+    def remove(self, ids: Iterable[str]) -> int:
+        """Delete candidates by id; unknown ids are ignored. Returns how many were removed."""
+        by_bucket = {}
+        for cid in ids:
+            c = self._where.pop(cid, None)
+            if c is not None:
+                by_bucket.setdefault(c, set()).add(cid)
+        removed = 0
+        for c, drop in by_bucket.items():
+            keep = [i for i, cid in enumerate(self._ids[c]) if cid not in drop]
+            removed += len(self._ids[c]) - len(keep)
+            self._vecs[c] = self._vecs[c][keep]
+            self._ids[c] = [self._ids[c][i] for i in keep]
+        return removed
+
+    def query(self, vector, k: int = 50, nprobe: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Return up to k (candidate_id, cosine_similarity) pairs, best first."""
+        return self._search(vector, k, nprobe or self.nprobe)
+
+    def search_exact(self, vector, k: int = 50) -> List[Tuple[str, float]]:
+        """Brute-force top-k over every stored vector (ground truth for recall checks)."""
+        return self._search(vector, k, len(self._vecs))
+
+    def _search(self, vector, k: int, nprobe: int) -> List[Tuple[str, float]]:
+        if not self._where:
+            return []
+        q = _normalize(vector)[0]
+        if not self.is_trained or nprobe >= len(self._vecs):
+            buckets = range(len(self._vecs))
+        else:
+            buckets = np.argpartition(-(self.centroids @ q), nprobe - 1)[:nprobe]
+
+        vecs = [self._vecs[c] for c in buckets if len(self._ids[c])]
+        ids = [cid for c in buckets for cid in self._ids[c]]
+        if not ids:
+            return []
+        sims = np.concatenate(vecs) @ q
+        k = min(k, len(ids))
+        top = np.argpartition(-sims, k - 1)[:k]
+        top = top[np.argsort(-sims[top])]
+        return [(ids[i], float(sims[i])) for i in top]
+
+    # ---------- persistence ----------
+    def save(self, path):
+        """Write the index to `path` (.npz). Ids are stored alongside as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        sizes = np.array([len(ids) for ids in self._ids], dtype=np.int64)
+        vecs, ids = self._stored()
+        centroids = self.centroids if self.is_trained else np.empty((0, self.dim), dtype=np.float32)
+        with open(path, "wb") as f:
+            np.savez(f, centroids=centroids, vectors=vecs, sizes=sizes)
+        meta = {"dim": self.dim, "nlist": self.nlist, "nprobe": self.nprobe, "ids": ids}
+        path.with_suffix(".ids.json").write_text(json.dumps(meta))
+
+    @classmethod
+    def load(cls, path) -> "IVFIndex":
+        path = Path(path)
+        meta = json.loads(path.with_suffix(".ids.json").read_text())
+        idx = cls(dim=meta["dim"], nlist=meta["nlist"], nprobe=meta.get("nprobe"))
+        with np.load(path) as data:
+            centroids, vecs, sizes = data["centroids"], data["vectors"], data["sizes"]
+        if len(centroids):
+            idx.centroids = centroids
+        offsets = np.concatenate([[0], np.cumsum(sizes)])
+        all_ids = meta["ids"]
+        idx._vecs, idx._ids = [], []
+        for c in range(len(sizes)):
+            lo, hi = offsets[c], offsets[c + 1]
+            idx._vecs.append(vecs[lo:hi].copy())
+            idx._ids.append(all_ids[lo:hi])
+            for cid in idx._ids[c]:
+                idx._where[cid] = c
+        return idx